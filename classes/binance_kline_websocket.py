@@ -1,9 +1,8 @@
-import json
+import orjson
 import websocket
-import pandas as pd
 import threading
-import time
-from typing import List, Callable
+from datetime import datetime, timezone
+from typing import List, Callable, Dict, Optional, Tuple
 import logging
 
 # Configuración de logging
@@ -16,16 +15,22 @@ class BinanceKlineWebSocket:
     Opera en un hilo separado para no interrumpir el hilo principal.
     """
     
-    def __init__(self, assets: List[str], interval: str = "1m"):
+    def __init__(self, assets: List[str], interval: str = "1m", dedupe: bool = True):
         """
         Inicializa el WebSocket de Binance para monitorear klines.
         
         Args:
             assets (List[str]): Lista de pares de trading (ej: ['BTCUSDT', 'ETHUSDT'])
             interval (str): Intervalo de las velas (ej: '1m', '5m', '1h', '1d')
+            dedupe (bool): Si es True, no se notifica a los callbacks cuando una vela
+                llega con el mismo precio de cierre y volumen que la anterior. En ese caso
+                la hora que reciben los callbacks (y que muestra el dashboard como "Act:")
+                es la del último cambio de precio o volumen, no la del último mensaje recibido
         """
         self.assets = [asset.upper() for asset in assets]
         self.interval = interval
+        self.dedupe = dedupe
+        self._last_ticks: Dict[str, Tuple[str, str]] = {}
         self.ws = None
         self.ws_thread = None
         self.running = False
@@ -54,51 +59,81 @@ class BinanceKlineWebSocket:
         streams = [f"{asset.lower()}@kline_{self.interval}" for asset in self.assets]
         return '/'.join(streams)
     
-    def add_callback(self, callback: Callable[[pd.DataFrame], None]):
+    def add_callback(self, callback: Callable[[Dict], None]):
         """
         Agrega una función callback que será llamada cuando se reciba un mensaje.
         
         Args:
-            callback (Callable[[pd.DataFrame], None]): Función que recibe un DataFrame con los datos
+            callback (Callable[[Dict], None]): Función que recibe un diccionario con los datos de la vela
         """
         with self.lock:
             self.callbacks.append(callback)
     
-    def _manipulate_data(self, source: dict) -> pd.DataFrame:
+    def _manipulate_data(self, source: dict) -> Optional[Dict]:
         """
-        Manipula los datos recibidos del WebSocket y los convierte en DataFrame.
+        Manipula los datos recibidos del WebSocket y los convierte en un diccionario de la vela.
         
         Args:
             source (dict): Datos recibidos del WebSocket
             
         Returns:
-            pd.DataFrame: DataFrame con los datos procesados
+            Optional[Dict]: Datos procesados de la vela, o None si el mensaje no es válido
         """
         try:
             # Extraer datos del mensaje
             kline_data = source['data']['k']
-            price = float(kline_data['c'])  # Precio de cierre
-            pair = source['data']['s']  # Símbolo del par
-            timestamp = pd.to_datetime(source['data']['E'], unit='ms')  # Timestamp
+            # Precio de cierre: se convierte una sola vez y se reutiliza para 'price' y 'close'
+            price = float(kline_data['c'])
+            # Símbolo del par a partir del nombre del stream (ej: 'btcusdt@kline_1m')
+            pair = source['stream'].partition('@')[0].upper()
+            timestamp = datetime.fromtimestamp(source['data']['E'] / 1000, tz=timezone.utc)  # Timestamp
             
-            # Crear DataFrame
-            data = {
-                'symbol': [pair],
-                'price': [price],
-                'timestamp': [timestamp],
-                'open': [float(kline_data['o'])],
-                'high': [float(kline_data['h'])],
-                'low': [float(kline_data['l'])],
-                'volume': [float(kline_data['v'])],
-                'close': [float(kline_data['c'])]
+            return {
+                'symbol': pair,
+                'price': price,
+                'timestamp': timestamp,
+                'open': float(kline_data['o']),
+                'high': float(kline_data['h']),
+                'low': float(kline_data['l']),
+                'volume': float(kline_data['v']),
+                'close': price
             }
             
-            df = pd.DataFrame(data)
-            return df
-            
         except Exception as e:
             logger.error(f"Error procesando datos: {e}")
-            return pd.DataFrame()
+            return None
+    
+    def _is_duplicate(self, source: dict) -> bool:
+        """
+        Verifica si la vela recibida no aporta cambios respecto a la última entregada del mismo stream.
+        Solo se comparan cierre y volumen: una vela repetida que solo cambia la hora del
+        evento se descarta, por lo que los consumidores no se enteran de ese mensaje.
+        
+        Args:
+            source (dict): Datos recibidos del WebSocket
+            
+        Returns:
+            bool: True si el precio de cierre y el volumen no cambiaron
+        """
+        return self._last_ticks.get(source['stream']) == self._get_tick(source)
+    
+    def _remember_tick(self, source: dict):
+        """
+        Guarda el cierre y volumen de una vela ya procesada y entregada a los callbacks.
+        
+        Args:
+            source (dict): Datos recibidos del WebSocket
+        """
+        self._last_ticks[source['stream']] = self._get_tick(source)
+    
+    @staticmethod
+    def _get_tick(source: dict) -> Tuple[str, str]:
+        """
+        Obtiene la clave de comparación de una vela.
+        Se usan los strings crudos para no convertir a float las velas repetidas.
+        """
+        kline_data = source['data']['k']
+        return (kline_data['c'], kline_data['v'])
     
     def _on_message(self, ws, message):
         """
@@ -106,25 +141,41 @@ class BinanceKlineWebSocket:
         
         Args:
             ws: WebSocket object
-            message (str): Mensaje recibido
+            message (bytes): Mensaje recibido sin decodificar. _run_websocket usa
+                run_forever(skip_utf8_validation=True): Binance solo envía JSON y el parseo
+                ya rechaza frames corruptos, así que websocket-client entrega bytes en vez de str
         """
         try:
+            # Descartar sin parsear los mensajes que no vienen de un stream combinado
+            # (ej: respuestas de suscripción)
+            if b'"stream"' not in message:
+                return
+            
             # Parsear el mensaje JSON
-            data = json.loads(message)
+            data = orjson.loads(message)
+            
+            # Ignorar velas repetidas (mismo cierre y volumen que la última recibida)
+            if self.dedupe and self._is_duplicate(data):
+                return
             
             # Procesar los datos
-            df = self._manipulate_data(data)
+            kline = self._manipulate_data(data)
             
-            if not df.empty:
+            if kline is not None:
+                # Recordar la vela solo si se pudo procesar: una inválida no debe
+                # filtrar a la siguiente válida con el mismo cierre y volumen
+                if self.dedupe:
+                    self._remember_tick(data)
+                
                 # Notificar a todos los callbacks registrados
                 with self.lock:
                     for callback in self.callbacks:
                         try:
-                            callback(df)
+                            callback(kline)
                         except Exception as e:
                             logger.error(f"Error en callback: {e}")
                             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Error decodificando JSON: {e}")
         except Exception as e:
             logger.error(f"Error procesando mensaje: {e}")
@@ -172,7 +223,7 @@ class BinanceKlineWebSocket:
                 on_open=self._on_open
             )
             
-            self.ws.run_forever()
+            self.ws.run_forever(skip_utf8_validation=True)
             
         except Exception as e:
             logger.error(f"Error ejecutando WebSocket: {e}")
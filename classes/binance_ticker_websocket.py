@@ -1,8 +1,6 @@
-import json
+import orjson
 import websocket
-import pandas as pd
 import threading
-import time
 from typing import List, Callable
 import logging
 
@@ -36,7 +34,7 @@ class BinanceTickerWebSocket:
     
     def _on_message(self, ws, message):
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             # data es una lista de objetos ticker
             if isinstance(data, list) and len(data) > 0:
                 with self.lock:
@@ -46,7 +44,7 @@ class BinanceTickerWebSocket:
                         except Exception as e:
                             logger.error(f"Error en callback de ticker: {e}")
                             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Error decodificando JSON: {e}")
         except Exception as e:
             logger.error(f"Error procesando mensaje ticker: {e}")
@@ -69,7 +67,7 @@ class BinanceTickerWebSocket:
                 on_close=self._on_close,
                 on_open=self._on_open
             )
-            self.ws.run_forever()
+            self.ws.run_forever(skip_utf8_validation=True)
         except Exception as e:
             logger.error(f"Error ejecutando WebSocket Ticker: {e}")
     
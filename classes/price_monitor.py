@@ -1,8 +1,7 @@
 import logging
 import threading
+import uuid
 from typing import List, Dict, Optional
-import pandas as pd
-from datetime import datetime
 
 from .binance_kline_websocket import BinanceKlineWebSocket
 
@@ -33,6 +32,13 @@ class PriceMonitor:
             return
             
         self._prices: Dict[str, Dict] = {}
+        # Versión de los precios: se incrementa con cada actualización recibida
+        self._version = 0
+        # Copia de _prices entregada a los lectores y versión a la que corresponde
+        self._snapshot: Dict[str, Dict] = {}
+        self._snapshot_version = 0
+        # Identificador de este proceso: las versiones solo son comparables dentro de él
+        self._session_id = uuid.uuid4().hex
         self._pairs: List[str] = self._load_pairs_from_json()
         self._websocket: Optional[BinanceKlineWebSocket] = None
         self._data_lock = threading.Lock()
@@ -99,29 +105,44 @@ class PriceMonitor:
         
         self._start_websocket()
 
-    def _on_price_update(self, df: pd.DataFrame):
+    def _on_price_update(self, kline: Dict):
         """Callback privado para procesar actualizaciones del WebSocket."""
         try:
-            if not df.empty:
-                symbol = df['symbol'].iloc[0]
-                price = df['price'].iloc[0]
-                volume = df['volume'].iloc[0]
-                timestamp = df['timestamp'].iloc[0]
-                
-                with self._data_lock:
-                    self._prices[symbol] = {
-                        'price': price,
-                        'volume': volume,
-                        'timestamp': timestamp,
-                        'last_update_str': timestamp.strftime('%H:%M:%S')
-                    }
+            timestamp = kline['timestamp']
+            
+            with self._data_lock:
+                self._version += 1
+                self._prices[kline['symbol']] = {
+                    'price': kline['price'],
+                    'volume': kline['volume'],
+                    'timestamp': timestamp,
+                    'last_update_str': timestamp.strftime('%H:%M:%S'),
+                    # Versión en la que se actualizó este par (ver get_version)
+                    'version': self._version
+                }
         except Exception as e:
             logger.error(f"Error procesando precio en Monitor: {e}")
 
     def get_prices(self) -> Dict[str, Dict]:
-        """Devuelve una copia segura de los precios actuales."""
+        """
+        Devuelve una copia segura de los precios actuales.
+        
+        La copia solo se regenera cuando llegaron precios nuevos desde la última llamada;
+        mientras tanto todos los lectores reciben la misma copia, que no debe modificarse.
+        """
         with self._data_lock:
-            return self._prices.copy()
+            if self._snapshot_version != self._version:
+                self._snapshot = self._prices.copy()
+                self._snapshot_version = self._version
+            return self._snapshot
+
+    def get_version(self) -> int:
+        """Devuelve la versión actual de los precios (aumenta con cada actualización recibida)."""
+        return self._version
+
+    def get_session_id(self) -> str:
+        """Devuelve el identificador del proceso al que pertenecen las versiones de get_version."""
+        return self._session_id
 
     def get_monitored_pairs(self) -> List[str]:
         """Devuelve la lista actual de pares monitoreados."""
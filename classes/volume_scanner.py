@@ -1,6 +1,5 @@
 import json
 import os
-import time
 import logging
 import threading
 from typing import List, Dict
@@ -4,10 +4,6 @@ Script para ejecutar el dashboard de Arbitbot
 """
 
 import sys
-import os
-
-# Add the web directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'web'))
 
 if __name__ == '__main__':
     print("🚀 Iniciando Arbitbot Dashboard...")
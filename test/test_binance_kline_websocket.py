@@ -0,0 +1,80 @@
+import sys
+import os
+import json
+import types
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# El filtro de velas repetidas no abre conexiones: alcanza con un módulo websocket vacío
+# si websocket-client no está instalado
+try:
+    import websocket
+except ImportError:
+    sys.modules['websocket'] = types.ModuleType('websocket')
+
+from classes.binance_kline_websocket import BinanceKlineWebSocket
+
+def make_frame(close, volume, event_time):
+    return json.dumps({
+        'stream': 'btcusdt@kline_1m',
+        'data': {
+            'e': 'kline',
+            'E': event_time,
+            's': 'BTCUSDT',
+            'k': {'o': '1.0', 'h': '2.0', 'l': '0.5', 'c': close, 'v': volume}
+        }
+    }).encode()
+
+def test_repeated_frames_are_filtered():
+    ws = BinanceKlineWebSocket(['BTCUSDT'])
+    received = []
+    ws.add_callback(received.append)
+
+    ws._on_message(None, make_frame('1.5', '10', 1700000000000))
+    # Misma vela, solo cambia la hora del evento
+    ws._on_message(None, make_frame('1.5', '10', 1700000001000))
+    # Cambia el volumen
+    ws._on_message(None, make_frame('1.5', '11', 1700000002000))
+    # Cambia el cierre
+    ws._on_message(None, make_frame('1.6', '11', 1700000003000))
+    # Mensaje que no es de un stream
+    ws._on_message(None, b'{"result":null,"id":1}')
+
+    assert len(received) == 3
+    assert [k['close'] for k in received] == [1.5, 1.5, 1.6]
+    assert [k['volume'] for k in received] == [10.0, 11.0, 11.0]
+    assert received[0]['symbol'] == 'BTCUSDT'
+
+def test_dedupe_disabled():
+    ws = BinanceKlineWebSocket(['BTCUSDT'], dedupe=False)
+    received = []
+    ws.add_callback(received.append)
+
+    frame = make_frame('1.5', '10', 1700000000000)
+    ws._on_message(None, frame)
+    ws._on_message(None, frame)
+
+    assert len(received) == 2
+
+def test_invalid_frame_does_not_filter_next_valid_one():
+    ws = BinanceKlineWebSocket(['BTCUSDT'])
+    received = []
+    ws.add_callback(received.append)
+
+    # Vela con cierre y volumen pero sin hora del evento ('E'): se descarta al procesarla
+    invalid = json.loads(make_frame('1.5', '10', 1700000000000))
+    del invalid['data']['E']
+    ws._on_message(None, json.dumps(invalid).encode())
+
+    # La siguiente vela válida con el mismo cierre y volumen debe llegar
+    ws._on_message(None, make_frame('1.5', '10', 1700000001000))
+
+    assert len(received) == 1
+    assert received[0]['close'] == 1.5
+
+if __name__ == "__main__":
+    test_repeated_frames_are_filtered()
+    test_dedupe_disabled()
+    test_invalid_frame_does_not_filter_next_valid_one()
+    print("✅ Tests de BinanceKlineWebSocket OK")
@@ -0,0 +1,57 @@
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from web.views.dashboard_view import get_price_state, get_unique_pairs, is_state_current
+
+PAIRS = ['BTCUSDT', 'ETHUSDT']
+
+def make_prices(btc_version, eth_version):
+    return {
+        'BTCUSDT': {'price': 65000.0, 'volume': 10.0, 'last_update_str': '12:00:00', 'version': btc_version},
+        'ETHUSDT': {'price': 3500.0, 'volume': 20.0, 'last_update_str': '12:00:01', 'version': eth_version},
+    }
+
+def test_get_price_state_since_version():
+    prices = make_prices(btc_version=3, eth_version=7)
+
+    assert set(get_price_state(prices, PAIRS)) == {'BTCUSDT', 'ETHUSDT'}
+    assert set(get_price_state(prices, PAIRS, since_version=5)) == {'ETHUSDT'}
+    assert get_price_state(prices, PAIRS, since_version=7) == {}
+
+def test_get_price_state_after_restart():
+    # Pestaña abierta antes del reinicio: guarda una versión alta de otro proceso
+    old_state = {'pairs': PAIRS, 'session': 'old-process', 'version': 500}
+    # Tras el reinicio el contador vuelve a empezar
+    prices = make_prices(btc_version=1, eth_version=2)
+
+    # Filtrar con la versión vieja descartaría precios reales...
+    assert get_price_state(prices, PAIRS, since_version=old_state['version']) == {}
+
+    # ...por eso ese estado no se considera vigente y se envía el estado completo
+    assert not is_state_current(old_state, PAIRS, 'new-process', 2)
+    assert set(get_price_state(prices, PAIRS)) == {'BTCUSDT', 'ETHUSDT'}
+
+def test_is_state_current():
+    state = {'pairs': PAIRS, 'session': 'abc', 'version': 4}
+
+    assert is_state_current(state, PAIRS, 'abc', 4)
+    assert is_state_current(state, PAIRS, 'abc', 9)
+    # Versión del navegador mayor que la del servidor
+    assert not is_state_current(state, PAIRS, 'abc', 2)
+    assert not is_state_current(state, ['BTCUSDT'], 'abc', 4)
+    assert not is_state_current(None, PAIRS, 'abc', 4)
+
+def test_get_unique_pairs():
+    # Un par repetido en config/pairs.json o en update_pairs no debe duplicar tarjetas (ids)
+    assert get_unique_pairs(['BTCUSDT', 'ETHUSDT', 'BTCUSDT', 'SOLUSDT', 'ETHUSDT']) == ['BTCUSDT', 'ETHUSDT', 'SOLUSDT']
+    assert get_unique_pairs([]) == []
+
+if __name__ == "__main__":
+    test_get_price_state_since_version()
+    test_get_price_state_after_restart()
+    test_is_state_current()
+    test_get_unique_pairs()
+    print("✅ Tests de dashboard_view OK")
@@ -3,8 +3,14 @@ import dash_bootstrap_components as dbc
 import sys
 import os
 
-# Add the parent directory to the path to import the views
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Make the views (web/) and the classes package (repo root) importable, both when
+# started through run_dashboard.py and as web/app.py. This is the only place that
+# touches sys.path; the guard skips directories that are already on it (e.g. the
+# repo root when started through run_dashboard.py or with web/ as the script dir).
+WEB_DIR = os.path.dirname(os.path.abspath(__file__))
+for path in (WEB_DIR, os.path.dirname(WEB_DIR)):
+    if path not in sys.path:
+        sys.path.append(path)
 from layout import create_main_layout
 from views.dashboard_view import get_dashboard_callbacks
 from classes.price_monitor import PriceMonitor
@@ -0,0 +1,41 @@
+/*
+ * Callbacks del lado del cliente para el dashboard.
+ * Formatean los precios crudos que publica el servidor en price-store.
+ */
+// Formateadores creados una sola vez: toLocaleString construye uno nuevo en cada llamada
+const PRICE_FORMAT = new Intl.NumberFormat('en-US', {minimumFractionDigits: 2, maximumFractionDigits: 2});
+const VOLUME_FORMAT = new Intl.NumberFormat('en-US', {maximumFractionDigits: 0});
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    dashboard: {
+        /*
+         * Devuelve los textos de precio, volumen y última actualización
+         * para cada tarjeta, en el mismo orden que cardIds.
+         * Los textos iguales a los que ya muestra la tarjeta se devuelven
+         * como no_update para no propagar cambios vacíos.
+         */
+        formatPrices: function(prices, cardIds, shownPrices, shownVolumes, shownUpdates) {
+            const noUpdate = window.dash_clientside.no_update;
+            const data = prices || {};
+            const priceStrs = [];
+            const volumeStrs = [];
+            const updateStrs = [];
+
+            cardIds.forEach(function(cardId, i) {
+                const item = data[cardId.index] || {};
+                const price = item.price || 0;
+                const volume = item.volume || 0;
+
+                const priceStr = price > 0 ? '$' + PRICE_FORMAT.format(price) : 'Cargando...';
+                const volumeStr = volume > 0 ? 'Vol: ' + VOLUME_FORMAT.format(volume) : '';
+                const updateStr = 'Act: ' + (item.last_update_str || 'N/A');
+
+                priceStrs.push(priceStr === shownPrices[i] ? noUpdate : priceStr);
+                volumeStrs.push(volumeStr === shownVolumes[i] ? noUpdate : volumeStr);
+                updateStrs.push(updateStr === shownUpdates[i] ? noUpdate : updateStr);
+            });
+
+            return [priceStrs, volumeStrs, updateStrs];
+        }
+    }
+});
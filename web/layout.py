@@ -1,6 +1,4 @@
-import dash
-from dash import dcc, html
-import dash_bootstrap_components as dbc
+from dash import html
 from views.dashboard_view import create_dashboard_layout
 
 def create_main_layout():
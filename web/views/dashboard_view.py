@@ -1,37 +1,64 @@
-import dash
-from dash import dcc, html, Input, Output
+from dash import dcc, html, Input, Output, State, ALL, ClientsideFunction, Patch, no_update
 import dash_bootstrap_components as dbc
-import sys
-import os
+from dash.exceptions import PreventUpdate
 
-# Add the parent directory to the path to import the classes
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from classes.price_monitor import PriceMonitor
 
-def create_price_card(symbol, price_data):
+def create_price_card(symbol):
     """
-    Crea una tarjeta Bootstrap con la información del precio.
-    Vista pura: recibe datos -> devuelve componente.
+    Crea una tarjeta Bootstrap para un par.
+    Vista pura: solo la estructura; los textos los completa el navegador
+    a partir de price-store (ver assets/dashboard.js).
     """
-    price = price_data.get('price', 0)
-    volume = price_data.get('volume', 0)
-    timestamp = price_data.get('last_update_str', 'N/A')
-    
-    # Formateo
-    price_str = f"${price:,.2f}" if price > 0 else "Cargando..."
-    volume_str = f"Vol: {volume:,.0f}" if volume > 0 else ""
-    
     return dbc.Col([
         dbc.Card([
             dbc.CardBody([
                 html.H4(symbol, className="card-title text-center"),
-                html.H2(price_str, className="text-primary text-center mb-2"),
-                html.Small(volume_str, className="text-muted d-block text-center"),
-                html.Small(f"Act: {timestamp}", className="text-muted d-block text-center mt-2")
+                html.H2("Cargando...", id={'type': 'card-price', 'index': symbol},
+                        className="text-primary text-center mb-2"),
+                html.Small("", id={'type': 'card-volume', 'index': symbol},
+                           className="text-muted d-block text-center"),
+                html.Small("Act: N/A", id={'type': 'card-update', 'index': symbol},
+                           className="text-muted d-block text-center mt-2")
             ])
         ], className="mb-3 shadow-sm")
     ], width=12, sm=6, md=4, lg=3)
 
+def get_unique_pairs(pairs):
+    """
+    Elimina los pares repetidos conservando el orden.
+    Cada tarjeta usa el símbolo como id, así que un par repetido duplicaría ids en la vista.
+    """
+    return list(dict.fromkeys(pairs))
+
+def get_price_state(prices, pairs, since_version=0):
+    """
+    Extrae los valores crudos que necesita la vista para cada par
+    actualizado después de since_version.
+    """
+    price_state = {}
+    for pair in pairs:
+        data = prices.get(pair)
+        if data and data['version'] > since_version:
+            price_state[pair] = {
+                'price': float(data['price']),
+                'volume': float(data['volume']),
+                'last_update_str': data['last_update_str']
+            }
+    return price_state
+
+def is_state_current(state, pairs, session_id, version):
+    """
+    Indica si el navegador ya tiene las tarjetas de estos pares y precios enviados por
+    este mismo proceso, de modo que alcanza con enviarle los pares que cambiaron.
+    Tras un reinicio del servidor, o si la petición llega a otro worker, el id de sesión
+    no coincide y la versión guardada en el navegador no sirve para filtrar.
+    """
+    return (bool(state)
+            and state.get('pairs') == pairs
+            and state.get('session') == session_id
+            and state.get('version', 0) <= version)
+
 def create_dashboard_layout():
     """
     Crea el layout del dashboard.
@@ -49,6 +76,13 @@ def create_dashboard_layout():
         # Contenedor de Tarjetas de Precios
         html.Div(id="cards-container", className="row"),
         
+        # Estado de la vista en el navegador (pares para los que se construyeron las tarjetas,
+        # proceso que los envió y versión de los últimos precios enviados)
+        dcc.Store(id="dashboard-state"),
+        
+        # Precios crudos por par; el formateo se hace del lado del cliente
+        dcc.Store(id="price-store"),
+        
         # Intervalo de actualización (1 segundo)
         dcc.Interval(
             id='interval-component',
@@ -61,29 +95,63 @@ def get_dashboard_callbacks(app):
     """
     Registra los callbacks (Controlador).
     """
+    # El modelo es un Singleton: se obtiene una sola vez al registrar los callbacks
+    monitor = PriceMonitor.get_instance()
     
     @app.callback(
         Output("cards-container", "children"),
-        [Input("interval-component", "n_intervals")]
+        Output("dashboard-state", "data"),
+        Output("price-store", "data"),
+        [Input("interval-component", "n_intervals")],
+        State("dashboard-state", "data")
     )
-    def update_dashboard(n_intervals):
+    def update_dashboard(n_intervals, state):
         """
-        Callback único que actualiza la vista basado en el modelo.
+        Publica los precios en price-store y construye las tarjetas solo cuando
+        cambia la lista de pares monitoreados o el estado del navegador es de otro proceso.
+        No envía nada si no llegaron precios nuevos desde la última actualización.
         """
-        monitor = PriceMonitor.get_instance()
+        # Obtener datos del modelo (la versión se lee antes que los precios para no saltear
+        # una actualización que llegue entre ambas lecturas)
+        version = monitor.get_version()
+        session_id = monitor.get_session_id()
+        monitored_pairs = get_unique_pairs(monitor.get_monitored_pairs())
+        
+        state_current = is_state_current(state, monitored_pairs, session_id, version)
+        if state_current and state['version'] == version:
+            raise PreventUpdate
         
-        # Obtener datos del modelo
         prices = monitor.get_prices()
-        monitored_pairs = monitor.get_monitored_pairs()
+        new_state = {'pairs': monitored_pairs, 'session': session_id, 'version': version}
+        
+        # Las tarjetas ya existen en el navegador: solo se envían los pares
+        # que cambiaron desde la versión que ya tiene
+        if state_current:
+            patch = Patch()
+            for pair, values in get_price_state(prices, monitored_pairs, state['version']).items():
+                patch[pair] = values
+            return no_update, new_state, patch
         
         # Generar la VISTA (Tarjetas)
-        cards = []
-        for pair in monitored_pairs:
-            # Si tenemos datos, usarlos, si no, placeholder
-            data = prices.get(pair, {})
-            cards.append(create_price_card(pair, data))
+        cards = [create_price_card(pair) for pair in monitored_pairs]
             
         if not cards:
             cards = [dbc.Alert("No hay pares configurados en config/pairs.json", color="warning")]
             
-        return cards
\ No newline at end of file
+        return cards, new_state, get_price_state(prices, monitored_pairs)
+    
+    # Formateo de precio, volumen y hora en el navegador (assets/dashboard.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace='dashboard', function_name='formatPrices'),
+        Output({'type': 'card-price', 'index': ALL}, "children"),
+        Output({'type': 'card-volume', 'index': ALL}, "children"),
+        Output({'type': 'card-update', 'index': ALL}, "children"),
+        Input("price-store", "data"),
+        State({'type': 'card-price', 'index': ALL}, "id"),
+        # Textos que muestran las tarjetas, para no reescribir los que no cambiaron
+        State({'type': 'card-price', 'index': ALL}, "children"),
+        State({'type': 'card-volume', 'index': ALL}, "children"),
+        State({'type': 'card-update', 'index': ALL}, "children"),
+        # Al cargar la página price-store está vacío y las tarjetas ya muestran "Cargando..."
+        prevent_initial_call=True
+    )